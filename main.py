@@ -7,6 +7,8 @@ Este simulador permite visualizar la Ley de Malus y experimentar con
 diferentes configuraciones de polarizadores.
 """
 
+import json
+
 import streamlit as st
 import matplotlib.pyplot as plt
 import numpy as np
@@ -24,50 +26,78 @@ st.set_page_config(
 )
 
 def setup_sidebar():
-    """Configura los controles en la barra lateral"""
+    """Configura los controles en la barra lateral
+
+    Los controles van dentro de un formulario: los movimientos de los
+    sliders se acumulan y solo disparan un rerun al pulsar "Aplicar".
+    """
     st.sidebar.title("🔅 Controles del Simulador")
-    
-    st.sidebar.markdown("### Parámetros de Simulación")
-    
-    # Intensidad inicial
-    I0 = st.sidebar.slider(
-        "Intensidad inicial I₀ (W/m²)",
-        min_value=0.1,
-        max_value=10.0,
-        value=1.0,
-        step=0.1,
-        help="Intensidad de la luz incidente no polarizada"
-    )
-    
-    # Número de polarizadores
-    num_polarizers = st.sidebar.selectbox(
-        "Número de polarizadores",
-        options=[2, 3, 4],
-        index=0,
-        help="Selecciona cuántos polarizadores incluir en la simulación"
-    )
-    
-    # Ángulos de los polarizadores
-    angles = []
-    st.sidebar.markdown("### Configuración de Ángulos")
-    
-    for i in range(1, num_polarizers):
-        angle = st.sidebar.slider(
-            f"Ángulo del polarizador {i+1} (°)",
-            min_value=0,
-            max_value=180,
-            value=45 if i == 1 else 90,
-            step=5,
-            help=f"Ángulo entre el polarizador {i} y {i+1}"
+
+    with st.sidebar.form("params"):
+        st.markdown("### Parámetros de Simulación")
+
+        # Intensidad inicial
+        I0 = st.slider(
+            "Intensidad inicial I₀ (W/m²)",
+            min_value=0.1,
+            max_value=10.0,
+            value=1.0,
+            step=0.1,
+            help="Intensidad de la luz incidente no polarizada"
         )
-        angles.append(angle)
-    
+
+        # Número de polarizadores
+        num_polarizers = st.selectbox(
+            "Número de polarizadores",
+            options=[2, 3, 4],
+            index=0,
+            help="Selecciona cuántos polarizadores incluir en la simulación"
+        )
+
+        # Ángulos de los polarizadores
+        angles = []
+        st.markdown("### Configuración de Ángulos")
+
+        for i in range(1, num_polarizers):
+            angle = st.slider(
+                f"Ángulo del polarizador {i+1} (°)",
+                min_value=0,
+                max_value=180,
+                value=45 if i == 1 else 90,
+                step=5,
+                help=f"Ángulo entre el polarizador {i} y {i+1}"
+            )
+            angles.append(angle)
+
+        st.form_submit_button("Aplicar")
+
     return I0, num_polarizers, angles
 
-def plot_malus_curve(I0, current_angle=None):
-    """Genera la gráfica de la Ley de Malus"""
-    simulator = PolarizationSimulator(I0)
-    angles, intensities = simulator.theoretical_curve()
+@st.cache_resource
+def get_simulator(I0: float):
+    """Devuelve un único simulador compartido por valor de I0
+
+    La instancia memoiza internamente su curva teórica; fuera de eso los
+    llamadores no deben mutarla ni modificar los arreglos que devuelve.
+    """
+    return PolarizationSimulator(I0)
+
+# Presupuesto de puntos de la curva enviada a Plotly. La curva cos² es suave,
+# por lo que un muestreo uniforme de este tamaño basta para el renderizado sin
+# inflar el JSON serializado en cada rerun. 361 puntos dan pasos exactos de 1°.
+_CURVE_POINTS = 361
+
+# Ángulos de referencia de la "Validación Teórica" y sus cos² precomputados
+# una sola vez al importar: la trigonometría queda fuera de la ruta de rerun.
+_REF_ANGLES = np.array([0., 30., 45., 60., 90.])
+_REF_COS2 = np.cos(np.radians(_REF_ANGLES)) ** 2
+# cos(90°) en coma flotante no es exactamente 0; fijar la extinción total
+_REF_COS2[_REF_ANGLES == 90.] = 0.0
+_REF_INDEX = pd.Index(_REF_ANGLES.astype(np.int64), name='Ángulo (°)')
+
+def plot_malus_curve(simulator, current_angle=None):
+    """Genera la gráfica de la Ley de Malus a partir del simulador cacheado"""
+    angles, intensities = simulator.theoretical_curve(points=_CURVE_POINTS)
     
     fig = go.Figure()
     
@@ -104,138 +134,140 @@ def plot_malus_curve(I0, current_angle=None):
     
     return fig
 
-def visualize_polarizer_system(angles, intensities):
-    """Visualiza el sistema de polarizadores"""
-    num_polarizers = len(intensities)
-    
-    fig = go.Figure()
-    
-    # Polarizadores como barras
-    for i in range(num_polarizers):
-        fig.add_trace(go.Bar(
-            x=[f'P{i+1}'],
-            y=[intensities[i]],
-            name=f'Después de P{i+1}',
-            text=[f'{intensities[i]:.3f} W/m²'],
-            textposition='auto',
-        ))
-    
-    fig.update_layout(
-        title='Intensidad en Cada Etapa del Sistema',
-        xaxis_title='Polarizador',
-        yaxis_title='Intensidad (W/m²)',
-        showlegend=False,
-        height=400
-    )
-    
-    return fig
+def visualize_polarizer_system(intensities):
+    """Visualiza el sistema de polarizadores con un gráfico de barras nativo
 
-def show_educational_content():
-    """Muestra contenido educativo"""
-    st.markdown("""
+    st.bar_chart genera un payload mucho menor que una figura Plotly y el
+    gráfico de etapas no necesita interactividad.
+    """
+    st.markdown("**Intensidad en Cada Etapa del Sistema**")
+    st.bar_chart(pd.DataFrame(
+        {'Intensidad (W/m²)': np.asarray(intensities)},
+        index=[f'P{i+1}' for i in range(len(intensities))]
+    ))
+
+@st.cache_data
+def _malus_fig_json(I0, current_angle):
+    """JSON serializado de la gráfica de Malus, memoizado por configuración
+
+    Cachear el JSON (y no el objeto Figure) evita repetir la serialización
+    de Plotly en cada rerun con la misma configuración.
+    """
+    return plot_malus_curve(get_simulator(I0), current_angle).to_json()
+
+# Contenido educativo estático, definido una sola vez a nivel de módulo para
+# no reconstruir las cadenas en cada rerun. La sección interactiva está aislada
+# en un fragmento, así que este bloque solo se emite en reruns completos.
+_EDU_INTRO_MD = """
     ## 📚 Marco Teórico - Polarización y Ley de Malus
-    
+
     ### ¿Qué es la polarización?
-    La polarización es un fenómeno donde las ondas de luz oscilan predominantemente 
-    en una dirección específica. Los polarizadores son dispositivos que solo permiten 
+    La polarización es un fenómeno donde las ondas de luz oscilan predominantemente
+    en una dirección específica. Los polarizadores son dispositivos que solo permiten
     el paso de luz que vibra en una dirección particular.
-    
+
     ### Ley de Malus
-    La **Ley de Malus**, descubierta por Étienne-Louis Malus en 1809, establece que 
-    cuando la luz polarizada pasa a través de un segundo polarizador (analizador), 
+    La **Ley de Malus**, descubierta por Étienne-Louis Malus en 1809, establece que
+    cuando la luz polarizada pasa a través de un segundo polarizador (analizador),
     la intensidad transmitida viene dada por:
-    
-    """)
-    
-    st.latex(r"I = I_0 \cdot \cos^2(\theta)")
-    
-    st.markdown("""
+
+    """
+
+_EDU_MALUS_LATEX = r"I = I_0 \cdot \cos^2(\theta)"
+
+_EDU_DETAILS_MD = """
     Donde:
     - \( I \) = Intensidad transmitida
     - \( I_0 \) = Intensidad incidente
     - \( \theta \) = Ángulo entre los ejes de transmisión de los polarizadores
-    
+
     ### Aplicaciones en Ingeniería
     - **Pantallas LCD**: Uso de polarizadores para controlar píxeles
     - **Gafas de sol polarizadas**: Reducen reflejos
     - **Fotografía**: Mejora de contrastes y eliminación de reflejos
     - **Comunicaciones ópticas**: Modulación de señales
     - **Sensores**: Medición de tensiones en materiales
-    """)
+    """
 
-def calculate_efficiency(angles, intensities):
-    """Calcula métricas de eficiencia del sistema"""
-    initial_I = intensities[0]
+def show_educational_content():
+    """Muestra contenido educativo"""
+    st.markdown(_EDU_INTRO_MD)
+    st.latex(_EDU_MALUS_LATEX)
+    st.markdown(_EDU_DETAILS_MD)
+
+def calculate_efficiency(I0, intensities):
+    """Calcula métricas de eficiencia del sistema
+
+    Returns:
+        tuple: (eficiencia de transmisión en %, pérdida total en W/m²)
+    """
     final_I = intensities[-1]
-    
-    efficiency = (final_I / initial_I) * 100
-    total_angle = sum(angles)
-    
-    return {
-        'eficiencia_transmision': efficiency,
-        'intensidad_inicial': initial_I,
-        'intensidad_final': final_I,
-        'perdida_total': initial_I - final_I,
-        'angulo_total': total_angle
-    }
+    return final_I / I0 * 100.0, I0 - final_I
 
-def main():
-    """Función principal de la aplicación"""
-    
-    # Header
-    st.title("🔅 Simulador Interactivo de Polarización y Ley de Malus")
-    st.markdown("---")
-    
-    # Sidebar con controles
-    I0, num_polarizers, angles = setup_sidebar()
-    
+@st.fragment
+def interactive_panel(I0, num_polarizers, angles):
+    """Sección interactiva: cálculos, gráficas, resultados y calculadora
+
+    Aislada en un fragmento para que sus reruns no re-rendericen el
+    contenido estático de la página.
+    """
     # Inicializar simulador
-    simulator = PolarizationSimulator(I0)
-    
-    # Calcular intensidades
-    if num_polarizers == 2:
-        current_intensity = simulator.malus_law(angles[0])
-        intensities = [I0, current_intensity]
+    simulator = get_simulator(I0)
+
+    # Reutilizar el último resultado si la configuración no cambió (p. ej. un
+    # rerun disparado por otro widget, como la calculadora de ángulo)
+    config_key = (I0, num_polarizers, tuple(angles))
+    if st.session_state.get('last_config') == config_key:
+        intensities = st.session_state['last_intensities']
     else:
+        # Calcular intensidades: una sola ruta para 2-4 polarizadores
         intensities = simulator.multiple_polarizers(angles)
-    
+
+        st.session_state['last_config'] = config_key
+        st.session_state['last_intensities'] = intensities
+
     # Layout principal
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # Gráfica de Ley de Malus
+        # Gráfica de Ley de Malus (Plotly por el marcador de configuración
+        # actual; JSON cacheado por configuración)
         current_angle = angles[0] if angles else 0
-        malus_fig = plot_malus_curve(I0, current_angle)
-        st.plotly_chart(malus_fig, use_container_width=True)
-        
-        # Sistema de polarizadores
-        system_fig = visualize_polarizer_system(angles, intensities)
-        st.plotly_chart(system_fig, use_container_width=True)
+        malus_fig = go.Figure(json.loads(_malus_fig_json(I0, current_angle)))
+        st.plotly_chart(
+            malus_fig,
+            use_container_width=True,
+            theme=None,
+            config={'displayModeBar': False}
+        )
+
+        # Sistema de polarizadores (gráfico nativo, payload reducido)
+        visualize_polarizer_system(intensities)
     
     with col2:
         st.markdown("### 📊 Resultados Actuales")
         
-        # Mostrar resultados numéricos
-        results_df = pd.DataFrame({
-            'Etapa': [f'P{i+1}' for i in range(len(intensities))],
-            'Intensidad (W/m²)': [f'{I:.4f}' for I in intensities],
-            'Porcentaje': [f'{(I/I0)*100:.1f}%' for I in intensities]
+        # Mostrar resultados numéricos: tabla estática sin construir un
+        # DataFrame (ni su serialización Arrow) en cada rerun
+        I_arr = np.asarray(intensities)
+        st.table({
+            'Etapa': [f'P{i+1}' for i in range(I_arr.size)],
+            'Intensidad (W/m²)': I_arr.round(4),
+            'Porcentaje (%)': (I_arr * (100.0 / I0)).round(1)
         })
         
-        st.dataframe(results_df, use_container_width=True)
-        
         # Métricas de eficiencia
         if len(angles) > 0:
-            metrics = calculate_efficiency(angles, intensities)
-            
+            efficiency, total_loss = calculate_efficiency(I0, intensities)
+
             st.metric(
                 label="Eficiencia de Transmisión",
-                value=f"{metrics['eficiencia_transmision']:.1f}%"
+                value=f"{efficiency:.1f}%"
             )
-            
+
             st.metric(
                 label="Pérdida Total",
-                value=f"{metrics['perdida_total']:.4f} W/m²"
+                value=f"{total_loss:.4f} W/m²"
             )
         
         # Calculadora de ángulo
@@ -254,7 +286,23 @@ def main():
                 st.info(f"**Ángulo requerido:** {required_angle:.1f}°")
             except ValueError as e:
                 st.error(str(e))
-    
+
+def main():
+    """Función principal de la aplicación"""
+
+    # Header
+    st.title("🔅 Simulador Interactivo de Polarización y Ley de Malus")
+    st.markdown("---")
+
+    # Sidebar con controles
+    I0, num_polarizers, angles = setup_sidebar()
+
+    # Inicializar simulador
+    simulator = get_simulator(I0)
+
+    # Sección interactiva (solo esta parte se vuelve a ejecutar con sus widgets)
+    interactive_panel(I0, num_polarizers, angles)
+
     # Contenido educativo
     st.markdown("---")
     show_educational_content()
@@ -267,21 +315,13 @@ def main():
     
     with col_val1:
         st.markdown("**Datos de Referencia (Ángulos comunes)**")
-        reference_data = {
-            0: I0,
-            30: I0 * (np.cos(np.radians(30)) ** 2),
-            45: I0 * (np.cos(np.radians(45)) ** 2),
-            60: I0 * (np.cos(np.radians(60)) ** 2),
-            90: 0.0
-        }
-        
-        reference_df = pd.DataFrame.from_dict(
-            reference_data, 
-            orient='index',
-            columns=['Intensidad Teórica (W/m²)']
+        I_ref = I0 * _REF_COS2
+
+        reference_df = pd.DataFrame(
+            {'Intensidad Teórica (W/m²)': I_ref},
+            index=_REF_INDEX
         )
-        reference_df.index.name = 'Ángulo (°)'
-        st.dataframe(reference_df)
+        st.table(reference_df)
     
     with col_val2:
         st.markdown("**Comparación con Configuración Actual**")
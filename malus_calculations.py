@@ -20,7 +20,8 @@ class PolarizationSimulator:
             initial_intensity (float): Intensidad inicial de la luz no polarizada (W/m²)
         """
         self.I0 = initial_intensity
-        
+        self._curve_cache = {}
+
     def malus_law(self, angle_degrees, I0=None):
         """
         Calcula la intensidad transmitida según la Ley de Malus
@@ -46,20 +47,21 @@ class PolarizationSimulator:
         Args:
             angles_degrees (list): Lista de ángulos entre polarizadores consecutivos
             I0 (float): Intensidad inicial
-            
+
         Returns:
-            list: Intensidades en cada etapa
+            np.ndarray: Intensidades en cada etapa
         """
         if I0 is None:
             I0 = self.I0
-            
-        intensities = [I0]
-        current_I = I0
-        
-        for angle in angles_degrees:
-            current_I = self.malus_law(angle, current_I)
-            intensities.append(current_I)
-            
+
+        # Cascada vectorizada: producto acumulado de los factores cos² de
+        # cada etapa, sin bucle Python por polarizador
+        factors = np.cos(np.radians(np.asarray(angles_degrees, dtype=np.float64))) ** 2
+        intensities = np.empty(factors.size + 1)
+        intensities[0] = I0
+        np.multiply.accumulate(factors, out=intensities[1:])
+        intensities[1:] *= I0
+
         return intensities
     
     def theoretical_curve(self, points=360):
@@ -70,12 +72,17 @@ class PolarizationSimulator:
             points (int): Número de puntos en la curva
             
         Returns:
-            tuple: (ángulos, intensidades)
+            tuple: (ángulos, intensidades); los arreglos están memoizados
+            por instancia y se comparten entre llamadas, no modificarlos
         """
-        angles = np.linspace(0, 360, points)
-        intensities = [self.malus_law(angle) for angle in angles]
-        
-        return angles, intensities
+        # Curva memoizada por instancia: solo depende de I0 y de points
+        if points not in self._curve_cache:
+            angles = np.linspace(0, 360, points)
+            # Evaluación vectorizada: una sola expresión numpy sobre el barrido
+            intensities = self.I0 * np.cos(np.radians(angles)) ** 2
+            self._curve_cache[points] = (angles, intensities)
+
+        return self._curve_cache[points]
     
     def validate_with_reference(self, reference_data):
         """
@@ -103,27 +110,47 @@ class PolarizationSimulator:
             
         return validation_results
 
+# Tabla de inversión de la Ley de Malus en [0°, 90°], precomputada una sola
+# vez al importar: cos²(θ) es monótona decreciente en ese rango, así que el
+# ángulo se recupera por búsqueda binaria sobre la tabla.
+_INV_ANGLES = np.linspace(0.0, 90.0, 901)
+_INV_COS2 = np.cos(np.radians(_INV_ANGLES)) ** 2
+# Tabla negada (creciente) para searchsorted, también precomputada
+_INV_NEG_COS2 = -_INV_COS2
+
 # Funciones de utilidad
 def calculate_transmission_angle(I_transmitted, I0):
     """
     Calcula el ángulo necesario para una transmisión específica
-    
+
     Args:
         I_transmitted (float): Intensidad transmitida deseada
         I0 (float): Intensidad incidente
-        
+
     Returns:
         float: Ángulo en grados
     """
     if I_transmitted > I0:
         raise ValueError("La intensidad transmitida no puede ser mayor que la incidente")
-    
+
     transmission_ratio = I_transmitted / I0
     if transmission_ratio < 0:
         raise ValueError("La intensidad no puede ser negativa")
-    
-    angle_rad = np.arccos(np.sqrt(transmission_ratio))
-    return np.degrees(angle_rad)
+
+    # Cerca de los extremos la inversa de cos² tiene pendiente infinita y la
+    # interpolación lineal pierde precisión: ahí se usa la forma cerrada
+    if transmission_ratio < 0.05 or transmission_ratio > 0.95:
+        return float(np.degrees(np.arccos(np.sqrt(transmission_ratio))))
+
+    # Búsqueda binaria sobre la tabla negada (creciente) en lugar de
+    # arccos(sqrt(...)), reutilizando la tabla precomputada. En el rango
+    # interior el error de interpolación queda por debajo de 1e-4°.
+    idx = np.searchsorted(_INV_NEG_COS2, -transmission_ratio)
+
+    # Interpolación lineal entre los dos puntos que encierran el objetivo
+    y0, y1 = _INV_COS2[idx - 1], _INV_COS2[idx]
+    x0, x1 = _INV_ANGLES[idx - 1], _INV_ANGLES[idx]
+    return float(x0 + (transmission_ratio - y0) * (x1 - x0) / (y1 - y0))
 
 def generate_sample_data():
     """
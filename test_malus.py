@@ -73,6 +73,16 @@ def test_calculate_transmission_angle():
     angle = calculate_transmission_angle(0.0, 1.0)
     assert abs(angle - 90.0) < 1e-10
 
+    # Caso: objetivo fuera de los nodos de la tabla (rama de interpolación)
+    angle = calculate_transmission_angle(0.37, 1.0)
+    expected = np.degrees(np.arccos(np.sqrt(0.37)))
+    assert abs(angle - expected) < 1e-3
+
+    # Caso: objetivo cerca del extremo (rama de forma cerrada)
+    angle = calculate_transmission_angle(0.99, 1.0)
+    expected = np.degrees(np.arccos(np.sqrt(0.99)))
+    assert abs(angle - expected) < 1e-10
+
 def test_edge_cases():
     """Prueba de casos límite"""
     simulator = PolarizationSimulator(1.0)